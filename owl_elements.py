@@ -0,0 +1,317 @@
+import gc
+import copy
+import json
+import time
+import random
+import tracemalloc
+from array import array
+
+from owl_naming import normalize_name, apply_naming_convention
+
+# 引用缺省标记：NONE 表示值为 None，MISSING 表示字典中没有该键
+NONE = -1
+MISSING = -2
+
+# 实例行标记：记录 data_properties / object_properties 键是否存在
+HAS_DATA_PROPERTIES = 1
+HAS_OBJECT_PROPERTIES = 2
+
+# 各命名空间及其命名后缀
+NAMESPACES = {
+    "classes": "_Class",
+    "data_properties": "_DP",
+    "object_properties": "_OP",
+    "individuals": "",
+}
+
+
+class SymbolTable:
+    """名称驻留表：字符串 <-> 整数ID"""
+
+    __slots__ = ("strings", "ids")
+
+    def __init__(self):
+        self.strings = []
+        self.ids = {}
+
+    def intern(self, name):
+        """驻留名称并返回ID，None 映射为 NONE"""
+        if name is None:
+            return NONE
+        sid = self.ids.get(name)
+        if sid is None:
+            sid = len(self.strings)
+            self.ids[name] = sid
+            self.strings.append(name)
+        return sid
+
+    def lookup(self, sid):
+        """按ID取回名称"""
+        return None if sid < 0 else self.strings[sid]
+
+    def rewrite(self, func):
+        """对表中每个名称执行一次改写，所有引用随之生效"""
+        self.strings = [func(name) for name in self.strings]
+        self.ids = {}
+        for sid, name in enumerate(self.strings):
+            self.ids.setdefault(name, sid)
+
+    def __len__(self):
+        return len(self.strings)
+
+
+class LiteralTable(SymbolTable):
+    """数据属性值驻留表：按 (类型, 值) 驻留，不可哈希的值原样存放不驻留"""
+
+    __slots__ = ()
+
+    def intern(self, value):
+        """驻留值并返回ID，True/1/1.0 等相等但类型不同的值互不合并"""
+        if value is None:
+            return NONE
+        try:
+            key = (type(value), value)
+            sid = self.ids.get(key)
+        except TypeError:
+            key = sid = None
+        if sid is None:
+            sid = len(self.strings)
+            self.strings.append(value)
+            if key is not None:
+                self.ids[key] = sid
+        return sid
+
+
+class CompactElements:
+    """本体要素的紧凑表示：名称按命名空间驻留，断言按列存储于 array 中"""
+
+    __slots__ = (
+        "symbols",
+        "literals",
+        "class_name", "class_super",
+        "dp_name", "dp_domain",
+        "op_name", "op_domain", "op_range",
+        "ind_name", "ind_type", "ind_flags",
+        "ind_dp_subject", "ind_dp_property", "ind_dp_value",
+        "ind_op_subject", "ind_op_property", "ind_op_value",
+    )
+
+    def __init__(self):
+        self.symbols = {namespace: SymbolTable() for namespace in NAMESPACES}
+        self.literals = LiteralTable()
+        for column in self.__slots__[2:]:
+            setattr(self, column, array("b" if column == "ind_flags" else "i"))
+
+    @staticmethod
+    def _ref(table, element, key):
+        if key not in element:
+            return MISSING
+        return table.intern(element[key])
+
+    @staticmethod
+    def _put(table, element, key, sid):
+        if sid != MISSING:
+            element[key] = table.lookup(sid)
+
+    @classmethod
+    def from_dict(cls, elements):
+        """由 parse_text_to_ontology 返回的字典格式构建"""
+        compact = cls()
+        classes = compact.symbols["classes"]
+        dps = compact.symbols["data_properties"]
+        ops = compact.symbols["object_properties"]
+        inds = compact.symbols["individuals"]
+        ref = cls._ref
+
+        for c in elements.get("classes", []):
+            compact.class_name.append(ref(classes, c, "name"))
+            compact.class_super.append(ref(classes, c, "super_class"))
+
+        for dp in elements.get("data_properties", []):
+            compact.dp_name.append(ref(dps, dp, "name"))
+            compact.dp_domain.append(ref(classes, dp, "domain"))
+
+        for op in elements.get("object_properties", []):
+            compact.op_name.append(ref(ops, op, "name"))
+            compact.op_domain.append(ref(classes, op, "domain"))
+            compact.op_range.append(ref(classes, op, "range"))
+
+        for row, ind in enumerate(elements.get("individuals", [])):
+            compact.ind_name.append(ref(inds, ind, "name"))
+            compact.ind_type.append(ref(classes, ind, "type"))
+            compact.ind_flags.append(
+                ("data_properties" in ind and HAS_DATA_PROPERTIES)
+                | ("object_properties" in ind and HAS_OBJECT_PROPERTIES)
+            )
+            for dp in ind.get("data_properties", []):
+                compact.ind_dp_subject.append(row)
+                compact.ind_dp_property.append(ref(dps, dp, "property"))
+                compact.ind_dp_value.append(ref(compact.literals, dp, "value"))
+            for op in ind.get("object_properties", []):
+                compact.ind_op_subject.append(row)
+                compact.ind_op_property.append(ref(ops, op, "property"))
+                compact.ind_op_value.append(ref(inds, op, "value"))
+
+        return compact
+
+    def to_dict(self):
+        """还原为原有字典格式（仅保留工具模式中定义的键，顶层四个列表总是输出）"""
+        classes = self.symbols["classes"]
+        dps = self.symbols["data_properties"]
+        ops = self.symbols["object_properties"]
+        inds = self.symbols["individuals"]
+        put = self._put
+        elements = {
+            "classes": [],
+            "data_properties": [],
+            "object_properties": [],
+            "individuals": []
+        }
+
+        for name, sup in zip(self.class_name, self.class_super):
+            c = {}
+            put(classes, c, "name", name)
+            put(classes, c, "super_class", sup)
+            elements["classes"].append(c)
+
+        for name, domain in zip(self.dp_name, self.dp_domain):
+            dp = {}
+            put(dps, dp, "name", name)
+            put(classes, dp, "domain", domain)
+            elements["data_properties"].append(dp)
+
+        for name, domain, rng in zip(self.op_name, self.op_domain, self.op_range):
+            op = {}
+            put(ops, op, "name", name)
+            put(classes, op, "domain", domain)
+            put(classes, op, "range", rng)
+            elements["object_properties"].append(op)
+
+        for name, typ, flags in zip(self.ind_name, self.ind_type, self.ind_flags):
+            ind = {}
+            put(inds, ind, "name", name)
+            put(classes, ind, "type", typ)
+            if flags & HAS_DATA_PROPERTIES:
+                ind["data_properties"] = []
+            if flags & HAS_OBJECT_PROPERTIES:
+                ind["object_properties"] = []
+            elements["individuals"].append(ind)
+
+        individuals = elements["individuals"]
+        for row, prop, value in zip(self.ind_dp_subject, self.ind_dp_property, self.ind_dp_value):
+            dp = {}
+            put(dps, dp, "property", prop)
+            put(self.literals, dp, "value", value)
+            individuals[row]["data_properties"].append(dp)
+        for row, prop, value in zip(self.ind_op_subject, self.ind_op_property, self.ind_op_value):
+            op = {}
+            put(ops, op, "property", prop)
+            put(inds, op, "value", value)
+            individuals[row]["object_properties"].append(op)
+
+        return elements
+
+    def apply_naming_convention(self):
+        """应用命名规范：每个命名空间的符号表只改写一遍，引用无需逐个处理"""
+        # 要素名称为 None 时与 normalize_name(None, suffix) 一致，记为 Unknown
+        name_columns = {
+            "classes": self.class_name,
+            "data_properties": self.dp_name,
+            "object_properties": self.op_name,
+            "individuals": self.ind_name,
+        }
+        for namespace, column in name_columns.items():
+            for i, sid in enumerate(column):
+                if sid == NONE:
+                    column[i] = self.symbols[namespace].intern("Unknown")
+
+        for namespace, suffix in NAMESPACES.items():
+            self.symbols[namespace].rewrite(lambda name, suffix=suffix: normalize_name(name, suffix))
+        return self
+
+    def __len__(self):
+        return len(self.class_name) + len(self.dp_name) + len(self.op_name) + len(self.ind_name)
+
+
+def generate_synthetic_elements(n_individuals=100000, n_classes=500, n_dps=200, n_ops=200, seed=0):
+    """生成大规模合成提取结果，用于内存基准测试"""
+    rng = random.Random(seed)
+    class_names = [f"类别 {i}" for i in range(n_classes)]
+    dp_names = [f"数据属性 {i}" for i in range(n_dps)]
+    op_names = [f"对象属性 {i}" for i in range(n_ops)]
+    ind_names = [f"实例 {i}" for i in range(n_individuals)]
+
+    return {
+        "classes": [
+            {"name": name, "super_class": rng.choice(class_names[:i]) if i else None}
+            for i, name in enumerate(class_names)
+        ],
+        "data_properties": [
+            {"name": name, "domain": rng.choice(class_names)} for name in dp_names
+        ],
+        "object_properties": [
+            {"name": name, "domain": rng.choice(class_names), "range": rng.choice(class_names)}
+            for name in op_names
+        ],
+        "individuals": [
+            {
+                "name": name,
+                "type": rng.choice(class_names),
+                "data_properties": [
+                    {"property": rng.choice(dp_names), "value": str(rng.randint(0, 1000))}
+                    for _ in range(3)
+                ],
+                "object_properties": [
+                    {"property": rng.choice(op_names), "value": rng.choice(ind_names)}
+                    for _ in range(3)
+                ],
+            }
+            for name in ind_names
+        ],
+    }
+
+
+def benchmark(n_individuals=100000):
+    """对比字典格式与紧凑格式的内存占用及命名规范耗时"""
+    # 经 JSON 往返，使每个引用都是独立的字符串对象，与模型返回的解析结果一致
+    raw = json.dumps(generate_synthetic_elements(n_individuals), ensure_ascii=False)
+    # 字典格式计时用的独立副本，在内存统计之外构建
+    dict_elements = copy.deepcopy(json.loads(raw))
+
+    gc.collect()
+    tracemalloc.start()
+    elements = json.loads(raw)
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+
+    compact = CompactElements.from_dict(elements)
+    del elements
+    gc.collect()
+    compact_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    apply_naming_convention(dict_elements)
+    dict_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compact.apply_naming_convention()
+    compact_seconds = time.perf_counter() - start
+
+    if compact.to_dict() != dict_elements:
+        raise RuntimeError("紧凑格式与字典格式的命名规范结果不一致")
+
+    print(f"合成提取结果：{n_individuals}个实例，{len(raw)}字节JSON")
+    print(f"- 字典格式内存: {dict_bytes / 1024 / 1024:.1f} MiB")
+    print(f"- 紧凑格式内存: {compact_bytes / 1024 / 1024:.1f} MiB")
+    print(f"- 字典格式命名规范耗时: {dict_seconds * 1000:.1f} ms")
+    print(f"- 紧凑格式命名规范耗时: {compact_seconds * 1000:.1f} ms")
+    return {
+        "dict_bytes": dict_bytes,
+        "compact_bytes": compact_bytes,
+        "dict_naming_seconds": dict_seconds,
+        "compact_naming_seconds": compact_seconds,
+    }
+
+
+if __name__ == "__main__":
+    benchmark()
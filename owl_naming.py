@@ -0,0 +1,52 @@
+def normalize_name(name, suffix=""):
+    """标准化命名并添加后缀"""
+    # 检查 name 是否为 None，若是则返回一个默认值
+    if name is None:
+        return f"Unknown{suffix}"
+    
+    # 正常情况下进行处理
+    name = name.strip().replace(" ", "_").replace("#", "")
+    return f"{name}{suffix}"
+
+def apply_naming_convention(elements):
+    """应用命名规范（预防措施）"""
+    # 类添加_Class后缀
+    for cls in elements["classes"]:
+        cls["name"] = normalize_name(cls["name"], "_Class")
+        # 确保 super_class 键存在且不为 None 再进行正规化
+        if "super_class" in cls and cls["super_class"] is not None:
+            cls["super_class"] = normalize_name(cls["super_class"], "_Class")
+    
+    # 数据属性添加_DP后缀
+    for dp in elements["data_properties"]:
+        dp["name"] = normalize_name(dp["name"], "_DP")
+        # 确保 domain 键存在且不为 None 再进行正规化
+        if "domain" in dp and dp["domain"] is not None:
+            dp["domain"] = normalize_name(dp["domain"], "_Class")
+    
+    # 对象属性添加_OP后缀
+    for op in elements["object_properties"]:
+        op["name"] = normalize_name(op["name"], "_OP")
+        # 确保 domain 和 range 键存在且不为 None 再进行正规化
+        if "domain" in op and op["domain"] is not None:
+            op["domain"] = normalize_name(op["domain"], "_Class")
+        if "range" in op and op["range"] is not None:
+            op["range"] = normalize_name(op["range"], "_Class")
+    
+    # 实例保持原名但规范化
+    for ind in elements["individuals"]:
+        ind["name"] = normalize_name(ind["name"])
+        if "type" in ind and ind["type"] is not None:
+            ind["type"] = normalize_name(ind["type"], "_Class")
+        
+        # 处理属性引用
+        for dp in ind.get("data_properties", []):
+            if "property" in dp and dp["property"] is not None:
+                dp["property"] = normalize_name(dp["property"], "_DP")
+        for op in ind.get("object_properties", []):
+            if "property" in op and op["property"] is not None:
+                op["property"] = normalize_name(op["property"], "_OP")
+            if "value" in op and op["value"] is not None:
+                op["value"] = normalize_name(op["value"])
+    
+    return elements
@@ -1,13 +1,22 @@
 import os
+import json
 import difflib
 import graphviz
 import owlready2 as owl
 from pathlib import Path
+from collections import deque
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+# 搜索与邻域查询的默认分页大小（方法与HTTP服务共用）
+SEARCH_LIMIT = 50
+NEIGHBORHOOD_LIMIT = 200
 
 class OntologyVisualizer:
     def __init__(self, owl_path):
         self.owl_path = Path(owl_path)
         self.onto = None
+        self._graph = None
         self._verify_ontology()
         
     def _verify_ontology(self):
@@ -22,6 +31,7 @@ class OntologyVisualizer:
         try:
             onto_uri = f"file://{self.owl_path.resolve()}"
             self.onto = owl.get_ontology(onto_uri).load()
+            self._graph = None
             print(f"成功加载本体: {self.onto.name}")
         except Exception as e:
             raise RuntimeError(f"本体加载失败: {str(e)}")
@@ -202,6 +212,273 @@ class OntologyVisualizer:
         print(f"概览图已保存至: {output_path}/ontology_overview.png")
         print(f"概览DOT文件已保存至: {overview_dot_path}")
 
+    def _build_node_link(self):
+        """构建节点-连边索引（仅构建一次，供导出与服务复用）"""
+        if self.onto is None:
+            raise RuntimeError("本体尚未加载，请先调用load_ontology()")
+        if self._graph is not None:
+            return self._graph
+
+        nodes = []
+        links = []
+        index = {}
+
+        def node_id(entity, kind):
+            if entity.iri not in index:
+                index[entity.iri] = len(nodes)
+                nodes.append({"id": len(nodes), "name": entity.name, "kind": kind, "iri": entity.iri})
+            return index[entity.iri]
+
+        classes = list(self.onto.classes())
+        object_properties = list(self.onto.object_properties())
+        data_properties = list(self.onto.data_properties())
+        individuals = list(self.onto.individuals())
+
+        for cls in classes:
+            node_id(cls, "class")
+        for prop in object_properties:
+            node_id(prop, "object_property")
+        for prop in data_properties:
+            node_id(prop, "data_property")
+        for ind in individuals:
+            node_id(ind, "individual")
+
+        # 继承关系
+        for cls in classes:
+            for parent in cls.is_a:
+                if isinstance(parent, owl.ThingClass):
+                    links.append((index[cls.iri], node_id(parent, "class"), "subClassOf"))
+
+        # 属性的定义域与值域
+        for prop in object_properties + data_properties:
+            for domain_cls in prop.domain:
+                if isinstance(domain_cls, owl.ThingClass):
+                    links.append((index[prop.iri], node_id(domain_cls, "class"), "domain"))
+        for prop in object_properties:
+            for range_cls in prop.range:
+                if isinstance(range_cls, owl.ThingClass):
+                    links.append((index[prop.iri], node_id(range_cls, "class"), "range"))
+
+        # 实例类型与对象属性断言（数据属性值不展开为节点）
+        for ind in individuals:
+            for cls in ind.is_a:
+                if isinstance(cls, owl.ThingClass):
+                    links.append((index[ind.iri], node_id(cls, "class"), "type"))
+            for prop in ind.get_properties():
+                if not isinstance(prop, owl.ObjectPropertyClass):
+                    continue
+                for value in prop[ind]:
+                    if isinstance(value, owl.Thing):
+                        links.append((index[ind.iri], node_id(value, "individual"), prop.name))
+
+        adjacency = [[] for _ in nodes]
+        for i, (src, dest, _) in enumerate(links):
+            adjacency[src].append(i)
+            adjacency[dest].append(i)
+
+        self._graph = {
+            "nodes": nodes,
+            "links": links,
+            "adjacency": adjacency,
+            "names": {},
+            "lower_names": [node["name"].lower() for node in nodes],
+        }
+        for node in nodes:
+            self._graph["names"].setdefault(node["name"], []).append(node["id"])
+        return self._graph
+
+    @staticmethod
+    def _link_record(link):
+        src, dest, label = link
+        return {"source": src, "target": dest, "label": label}
+
+    def export_node_link(self, shard_size=None):
+        """导出紧凑的节点-连边JSON，指定shard_size时按行分片写出NDJSON"""
+        if shard_size is not None and shard_size <= 0:
+            raise ValueError("shard_size必须为正整数")
+        graph = self._build_node_link()
+        output_path = self.owl_path.parent / "visualizations"
+        output_path.mkdir(exist_ok=True)
+
+        # 清理上次导出的分片，避免新旧分片混杂
+        for old_shard in output_path.glob("ontology_graph_*.ndjson"):
+            old_shard.unlink()
+
+        if shard_size is None:
+            json_path = output_path / "ontology_graph.json"
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "ontology": self.onto.name,
+                        "nodes": graph["nodes"],
+                        "links": [self._link_record(link) for link in graph["links"]],
+                    },
+                    f,
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                )
+            print(f"节点-连边JSON已保存至: {json_path}")
+            return [json_path]
+
+        def records():
+            for node in graph["nodes"]:
+                yield {"type": "node", **node}
+            for link in graph["links"]:
+                yield {"type": "link", **self._link_record(link)}
+
+        shard_paths = []
+        f = None
+        try:
+            for i, record in enumerate(records()):
+                if i % shard_size == 0:
+                    if f is not None:
+                        f.close()
+                    shard_path = output_path / f"ontology_graph_{len(shard_paths):05d}.ndjson"
+                    f = open(shard_path, "w", encoding="utf-8")
+                    shard_paths.append(shard_path)
+                f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+                f.write("\n")
+        finally:
+            if f is not None:
+                f.close()
+        print(f"NDJSON分片已保存至: {output_path}（共{len(shard_paths)}个）")
+        return shard_paths
+
+    def _resolve_node(self, node=None, node_id=None):
+        """按节点名称或节点ID查找节点，名称对应多个节点时报错"""
+        graph = self._build_node_link()
+        if node_id is not None:
+            node_id = int(node_id)
+            if not 0 <= node_id < len(graph["nodes"]):
+                raise KeyError(f"未找到节点ID: {node_id}")
+            return node_id
+
+        candidates = graph["names"].get(node)
+        if not candidates:
+            raise KeyError(f"未找到节点: {node}")
+        if len(candidates) > 1:
+            kinds = ", ".join(f"{i}({graph['nodes'][i]['kind']})" for i in candidates)
+            raise ValueError(f"名称'{node}'对应多个节点，请改用节点ID: {kinds}")
+        return candidates[0]
+
+    def search(self, keyword, offset=0, limit=SEARCH_LIMIT):
+        """按名称子串搜索节点，分页返回"""
+        graph = self._build_node_link()
+        keyword = keyword.lower()
+        matches = [i for i, name in enumerate(graph["lower_names"]) if keyword in name]
+        return {
+            "total": len(matches),
+            "offset": offset,
+            "limit": limit,
+            "nodes": [graph["nodes"][i] for i in matches[offset:offset + limit]],
+        }
+
+    def neighborhood(self, node=None, k=1, offset=0, limit=NEIGHBORHOOD_LIMIT, node_id=None):
+        """返回指定节点k跳邻域（按名称node或节点ID node_id指定），按BFS顺序分页
+
+        每页返回本页节点与BFS顺序中位于本页及之前节点之间的连边，
+        逐页合并即可还原完整邻域。BFS在收集到本页所需节点后即停止，
+        因此 total 仅为已发现节点数，has_more 表示是否还有后续页。
+        """
+        if node is None and node_id is None:
+            raise ValueError("必须指定节点名称node或节点ID id")
+        if node is not None and node_id is not None:
+            raise ValueError("节点名称node与节点ID id不能同时指定")
+        graph = self._build_node_link()
+        center = self._resolve_node(node, node_id)
+        end = offset + limit
+
+        hops = {center: 0}
+        order = [center]
+        queue = deque([center])
+        while queue and len(order) <= end:
+            current = queue.popleft()
+            if hops[current] >= k:
+                continue
+            for link_id in graph["adjacency"][current]:
+                src, dest, _ = graph["links"][link_id]
+                other = dest if src == current else src
+                if other not in hops:
+                    hops[other] = hops[current] + 1
+                    order.append(other)
+                    queue.append(other)
+                    if len(order) > end:
+                        break
+
+        rank = {n: i for i, n in enumerate(order[:end])}
+        page = order[offset:end]
+        link_ids = set()
+        for n in page:
+            for link_id in graph["adjacency"][n]:
+                src, dest, _ = graph["links"][link_id]
+                other = dest if src == n else src
+                if other in rank and rank[other] <= rank[n]:
+                    link_ids.add(link_id)
+
+        return {
+            "center": center,
+            "k": k,
+            "total": len(order),
+            "has_more": len(order) > end,
+            "offset": offset,
+            "limit": limit,
+            "nodes": [dict(graph["nodes"][i], hop=hops[i]) for i in page],
+            "links": [self._link_record(graph["links"][i]) for i in sorted(link_ids)],
+        }
+
+    def serve(self, host="127.0.0.1", port=8765, max_k=3, max_limit=1000):
+        """启动本地HTTP服务，按需返回搜索与邻域查询的分页JSON"""
+        graph = self._build_node_link()
+        visualizer = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _send_json(self, status, payload):
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = {key: values[0] for key, values in parse_qs(url.query).items()}
+                try:
+                    default_limit = NEIGHBORHOOD_LIMIT if url.path == "/neighborhood" else SEARCH_LIMIT
+                    offset = max(int(params.get("offset", 0)), 0)
+                    limit = min(max(int(params.get("limit", default_limit)), 1), max_limit)
+                    if url.path == "/stats":
+                        self._send_json(200, {
+                            "ontology": visualizer.onto.name,
+                            "nodes": len(graph["nodes"]),
+                            "links": len(graph["links"]),
+                        })
+                    elif url.path == "/search":
+                        self._send_json(200, visualizer.search(params.get("q", ""), offset, limit))
+                    elif url.path == "/neighborhood":
+                        k = min(max(int(params.get("k", 1)), 0), max_k)
+                        self._send_json(200, visualizer.neighborhood(
+                            params.get("node"), k, offset, limit, node_id=params.get("id")
+                        ))
+                    else:
+                        self._send_json(404, {"error": f"未知路径: {url.path}"})
+                except KeyError as e:
+                    self._send_json(404, {"error": str(e.args[0])})
+                except ValueError as e:
+                    self._send_json(400, {"error": f"参数错误: {str(e)}"})
+                except Exception as e:
+                    self._send_json(500, {"error": f"服务器内部错误: {str(e)}"})
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        print(f"本体邻域服务已启动: http://{host}:{port} （节点 {len(graph['nodes'])}，连边 {len(graph['links'])}）")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
 # 使用示例
 if __name__ == "__main__":
     # 配置参数
@@ -220,4 +497,9 @@ if __name__ == "__main__":
     
     # 可添加多个关键词查询
     #visualizer.visualize_entity("Organization")
-    #visualizer.visualize_entity("Event")
\ No newline at end of file
+    #visualizer.visualize_entity("Event")
+
+    # 超大本体：导出节点-连边JSON（或NDJSON分片），或启动邻域查询服务
+    #visualizer.export_node_link()
+    #visualizer.export_node_link(shard_size=50000)
+    #visualizer.serve(port=8765)
\ No newline at end of file